@@ -4,14 +4,25 @@ import sqlite3
 import os
 from datetime import datetime
 import re
+import uuid
 
 # --- Global Configurations ---
 # The database file will be stored in the root of the GitHub repo.
 DB_FILE = 'tracker.db' 
 TABLE_NAME = 'applications'
 ALLOWED_STATUSES = ["Submitted", "Interviewing", "Rejected", "Not Submitted"]
-URL_REGEX = r"https?://(?:www\.|(?!www\.))[a-zA-Z0-9]+\.[^\s]{2,}"
+STATUS_INDEX = {status: i for i, status in enumerate(ALLOWED_STATUSES)}
+PAGE_SIZE = 500  # rows sent to the browser per page in the data view
+DATE_DISPLAY_FORMAT = 'YYYY-MM-DD HH:mm'  # Streamlit column_config (moment.js) syntax
+URL_REGEX = r"https?://(?:www\.|(?!www\.))[a-zA-Z0-9]+\.\S{2,}"
+URL_RE = re.compile(URL_REGEX)  # compiled once at import instead of on every submit
 HEADERS = ['Job_Title', 'Company', 'Date_Submitted', 'Requirements_Matched', 'Link', 'Status', "Require_Enhancement"]
+# Date_Submitted is set on add and never edited, so updates leave it untouched
+EDITABLE_HEADERS = [h for h in HEADERS if h != 'Date_Submitted']
+# Low-cardinality columns held as pandas categoricals (int codes + a small lookup table)
+CATEGORY_COLUMNS = ['Company', 'Status']
+INSERT_SQL = f"INSERT INTO {TABLE_NAME} ({', '.join(HEADERS)}) VALUES ({', '.join('?' * len(HEADERS))})"
+UPDATE_SQL = f"UPDATE {TABLE_NAME} SET {', '.join(f'{h} = ?' for h in EDITABLE_HEADERS)} WHERE rowid = ?"
 
 # --- Core Data Persistence Functions ---
 
@@ -19,11 +30,21 @@ HEADERS = ['Job_Title', 'Company', 'Date_Submitted', 'Requirements_Matched', 'Li
 def get_db_connection():
     """
     Establishes a connection to the SQLite database.
-    Uses st.cache_resource to ensure the connection object is reused across reruns.
+    Uses st.cache_resource to ensure the connection object is reused across reruns,
+    so the table setup below also runs once per connection rather than on every rerun.
     """
     try:
         # Connects to the database file. If it doesn't exist, it creates it.
-        conn = sqlite3.connect(DB_FILE)
+        # The cached connection is shared by Streamlit's script threads, hence check_same_thread.
+        conn = sqlite3.connect(DB_FILE, check_same_thread=False)
+        # WAL lets readers run during writes and, with synchronous=NORMAL, only syncs at
+        # checkpoints instead of on every commit, which is enough for this single-user app.
+        # Until a checkpoint, recent commits live in the git-ignored tracker.db-wal (see checkpoint_db).
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute("PRAGMA temp_store=MEMORY")
+        conn.execute("PRAGMA mmap_size=134217728")
+        initialize_database(conn)
         return conn
     except Exception as e:
         st.error(f"Error connecting to database: {e}")
@@ -31,16 +52,18 @@ def get_db_connection():
 
 def initialize_database(conn):
     """
-    Creates the applications table if it doesn't exist.
+    Creates the applications table (and the indexes used by WHERE-based deletes)
+    if they don't exist.
     """
     try:
         cursor = conn.cursor()
         # SQL statement to create the table
         create_table_sql = f"""
         CREATE TABLE IF NOT EXISTS {TABLE_NAME} (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
             Job_Title TEXT,
             Company TEXT,
-            Date_Submitted TEXT,
+            Date_Submitted INTEGER,
             Requirements_Matched TEXT,
             Link TEXT,
             Status TEXT,
@@ -48,54 +71,194 @@ def initialize_database(conn):
         );
         """
         cursor.execute(create_table_sql)
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_status ON {TABLE_NAME}(Status)")
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS idx_company ON {TABLE_NAME}(Company)")
+        # Older versions stored Date_Submitted as 'YYYY-MM-DD HH:MM' text; convert those rows
+        # to Unix epoch seconds once (a no-op when nothing is left to convert).
+        # Text that strftime can't parse is left as-is rather than overwritten with NULL.
+        cursor.execute(
+            f"UPDATE {TABLE_NAME} SET Date_Submitted = CAST(strftime('%s', Date_Submitted) AS INTEGER) "
+            "WHERE Date_Submitted LIKE '____-__-__%' AND strftime('%s', Date_Submitted) IS NOT NULL"
+        )
         conn.commit()
+        checkpoint_db(conn)
         # st.toast("Database table initialized.")
     except Exception as e:
         st.error(f"Error initializing database table: {e}")
 
 
-@st.cache_data(show_spinner="Loading application data from SQLite...")
-def load_data_from_db():
+def checkpoint_db(conn):
     """
-    Loads all data from the SQLite table into a Pandas DataFrame.
+    Copies committed WAL pages back into the database file and empties tracker.db-wal.
+    SQLite only does this by itself every ~1000 pages or when the last connection closes,
+    and the -wal file is git-ignored, so this runs on the reload button (and at startup)
+    to make tracker.db self-contained before it is committed.
+    """
+    conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+
+def get_db_mtime():
+    """
+    Returns the last modification time of the database (0.0 if it doesn't exist yet).
+    In WAL mode recent commits only touch the -wal file, so it is checked as well.
+    """
+    paths = (DB_FILE, DB_FILE + '-wal')
+    return max((os.path.getmtime(p) for p in paths if os.path.exists(p)), default=0.0)
+
+
+@st.cache_resource(show_spinner="Loading application data from SQLite...", max_entries=1)
+def load_data_from_db(db_mtime):
+    """
+    Loads all data from the SQLite table into a Pandas DataFrame, indexed by the row id
+    so single rows can later be updated/deleted in place.
+    The db_mtime argument is part of the cache key, so the table is only re-read
+    when the database file has actually changed on disk; writes therefore never need
+    to clear this cache, and only the newest snapshot is kept.
+    Cached as a shared resource (no pickling on every hit), so callers that mutate
+    the frame must work on a .copy().
     """
     conn = get_db_connection()
     if conn is None:
         return pd.DataFrame(columns=HEADERS)
 
     try:
-        # Use Pandas to read the entire SQL table into a DataFrame
-        df = pd.read_sql_query(f"SELECT * FROM {TABLE_NAME}", conn)
-        df = df.reindex(columns=HEADERS, fill_value='')
+        # Use Pandas to read the entire SQL table into a DataFrame.
+        # rowid is aliased by the id column on new tables and implicit on older ones.
+        df = pd.read_sql_query(
+            f"SELECT rowid AS id, {', '.join(HEADERS)} FROM {TABLE_NAME} ORDER BY rowid", conn, index_col='id'
+        )
+        # Tables created by older to_sql saves can carry non-TEXT column affinities
+        # (e.g. INTEGER for Requirements_Matched); normalise everything back to text.
+        # Arrow-backed strings keep comparisons/unique() in Arrow's C++ kernels.
+        df = df.fillna('').astype(str).astype('string[pyarrow]')
+        # Dates are stored as epoch seconds and held as datetime64 so they compare and sort natively
+        df['Date_Submitted'] = pd.to_datetime(pd.to_numeric(df['Date_Submitted'], errors='coerce'), unit='s')
+        df = df.astype({col: 'category' for col in CATEGORY_COLUMNS})
         return df
     except Exception as e:
         st.error(f"Error reading data from table: {e}")
         return pd.DataFrame(columns=HEADERS)
 
 
-def save_data_to_db(df):
+def to_db_value(col, value):
     """
-    Saves the complete DataFrame back to the SQLite table, replacing the old data.
-    This ensures all historical data and changes are saved atomically.
+    Converts a single in-memory cell into the value stored in SQLite.
+    Dates are datetime64 in the DataFrame but stored as integer Unix epoch seconds.
+    """
+    if col == 'Date_Submitted':
+        return None if pd.isna(value) else int(value.timestamp())
+    return value
+
+
+def insert_row_to_db(row):
+    """
+    Appends a single new entry to the SQLite table.
+    Only the new row is written, instead of rewriting the whole table on every add.
+    Returns the id of the new row, or None if it could not be saved.
     """
     conn = get_db_connection()
     if conn is None:
-        return
+        return None
 
     try:
-        # 'replace' argument ensures the old table content is deleted and replaced 
-        # with the current, complete DataFrame state (old + new rows/changes).
-        df.to_sql(TABLE_NAME, conn, if_exists='replace', index=False)
+        cursor = conn.execute(INSERT_SQL, [to_db_value(h, row[h]) for h in HEADERS])
         conn.commit()
         st.toast("Data saved successfully to SQLite database.", icon="💾")
+        return cursor.lastrowid
     except Exception as e:
         st.error(f"Error saving data to database: {e}")
+        return None
+
+
+def update_row_in_db(row_id, row):
+    """
+    Overwrites the entry with the given id in the SQLite table.
+    Only that row's editable columns are written, instead of rewriting the whole table
+    on every edit; Date_Submitted keeps whatever is stored (including unparseable text).
+    Returns True if the row was saved.
+    """
+    conn = get_db_connection()
+    if conn is None:
+        return False
+
+    try:
+        cursor = conn.execute(UPDATE_SQL, [row[h] for h in EDITABLE_HEADERS] + [int(row_id)])
+        if cursor.rowcount != 1:
+            # e.g. deleted from another tab since this session loaded it
+            conn.rollback()
+            st.error("Error saving data to database: this entry no longer exists. Reload the data from the Configuration page.")
+            return False
+        conn.commit()
+        st.toast("Data saved successfully to SQLite database.", icon="💾")
+        return True
+    except Exception as e:
+        st.error(f"Error saving data to database: {e}")
+        return False
+
+
+def delete_rows_from_db(col, value, row_ids):
+    """
+    Deletes every row where `col` equals `value` directly inside the SQLite table.
+    Only the matching rows are touched, instead of rewriting all surviving rows.
+    `row_ids` are the matching rows in the session frame; they are only needed for
+    missing dates (NaT), which can be NULL or unparseable text in the database.
+    Returns True if the rows were deleted.
+    """
+    if col not in HEADERS:
+        # Column names can't be bound as SQL parameters, so only allow known ones.
+        st.error(f"Error deleting data: unknown column '{col}'.")
+        return False
+
+    conn = get_db_connection()
+    if conn is None:
+        return False
+
+    try:
+        db_value = to_db_value(col, value)
+        if db_value is None:
+            # `= NULL` never matches, so missing values are deleted by IS NULL plus their row ids
+            ids = [int(i) for i in row_ids]
+            delete_sql = f"DELETE FROM {TABLE_NAME} WHERE {col} IS NULL OR rowid IN ({', '.join('?' * len(ids))})"
+            params = ids
+        else:
+            delete_sql = f"DELETE FROM {TABLE_NAME} WHERE {col} = ?"
+            if value == '':
+                # NULLs are loaded as empty strings, so they match an empty value too
+                delete_sql += f" OR {col} IS NULL"
+            params = (db_value,)
+        with conn:
+            conn.execute(delete_sql, params)
+        st.toast("Data saved successfully to SQLite database.", icon="💾")
+        return True
+    except Exception as e:
+        st.error(f"Error deleting data from database: {e}")
+        return False
+
+
+def set_session_row(df, idx, row):
+    """
+    Writes `row` into the in-memory DataFrame at `idx`, appending it if `idx` is new.
+    Categorical columns get any new value registered first, so every column keeps its dtype.
+    """
+    for col in CATEGORY_COLUMNS:
+        if isinstance(df[col].dtype, pd.CategoricalDtype) and row[col] not in df[col].cat.categories:
+            df[col] = df[col].cat.add_categories([row[col]])
+    df.loc[idx, HEADERS] = [row[col] for col in HEADERS]
+
+
+def set_session_df(df):
+    """
+    Stores `df` as the session's working frame under a fresh df_version.
+    The cached form helpers key on df_version instead of hashing the frame, because
+    st.cache_data only samples large frames and could miss an edited row.
+    """
+    st.session_state.df = df
+    st.session_state.df_version = uuid.uuid4().hex
 
 
 # --- INITIAL SETUP ---
-conn = get_db_connection()
-if conn:
-    initialize_database(conn)
+# Opening the (cached) connection also creates the table on first use.
+get_db_connection()
 
 # --- Streamlit UI Pages/Functions ---
 
@@ -106,14 +269,20 @@ def show_configuration():
     st.header("⚙️ Data Source Configuration")
     
     st.success(f"Database is currently using a persistent SQLite file: `{DB_FILE}`.")
-    st.info("Your data is saved directly to this file in the repository.")
+    st.info("Your data is saved directly to this file in the repository. "
+            "Use the reload button below (or stop the app) before committing it, "
+            "so recent changes are written from the write-ahead log into the file.")
 
     st.markdown("---")
     
     # --- CRITICAL FIX: Clear cache and force reload ---
     if st.button("🔄 **Clear Streamlit Cache and Force Full Reload**", type="primary"):
+        conn = get_db_connection()
+        if conn is not None:
+            checkpoint_db(conn)
         st.cache_data.clear()
-        st.session_state.df = load_data_from_db() 
+        st.cache_resource.clear()
+        set_session_df(load_data_from_db(get_db_mtime()).copy())
         st.success("Cache cleared and data reloaded successfully!")
         st.rerun() 
 
@@ -125,7 +294,19 @@ def show_data_view(df):
     if df.empty:
         st.info("The tracker is currently empty. Add a new entry to get started!")
     else:
-        st.dataframe(df, use_container_width=True)
+        # Only one page of rows is serialized and sent to the browser per rerun
+        total_pages = (len(df) - 1) // PAGE_SIZE + 1
+        page_number = 1
+        if total_pages > 1:
+            page_number = st.number_input(f"Page (1-{total_pages}):", min_value=1, max_value=total_pages, value=1, step=1)
+        start = (page_number - 1) * PAGE_SIZE
+
+        # Dates are formatted by the frontend, so the frame isn't copied just for display
+        st.dataframe(
+            df.iloc[start:start + PAGE_SIZE],
+            use_container_width=True,
+            column_config={'Date_Submitted': st.column_config.DatetimeColumn(format=DATE_DISPLAY_FORMAT)},
+        )
         st.markdown(f"**Total Entries:** {len(df)}")
 
 
@@ -146,11 +327,12 @@ def show_add_entry_form(df):
         if submitted:
             if not job_title or not company or not job_link:
                 st.error("Please fill in Job Title, Company, and Job Link.")
-            elif not re.fullmatch(URL_REGEX, job_link):
+            # The cheap scheme check rejects obvious non-URLs before running the regex
+            elif not job_link.startswith(('http://', 'https://')) or not URL_RE.fullmatch(job_link):
                 st.error("❌ Invalid URL Format. Please enter a full link starting with http:// or https://.")
             else:
-                date_submitted = datetime.now().strftime('%Y-%m-%d %H:%M')
-                new_entry = pd.DataFrame([{
+                date_submitted = pd.Timestamp(datetime.now()).floor('min')
+                new_row = {
                     'Job_Title': job_title,
                     'Company': company,
                     'Date_Submitted': date_submitted,
@@ -158,12 +340,27 @@ def show_add_entry_form(df):
                     'Link': job_link,
                     'Status': status,
                     'Require_Enhancement': require_enhancement
-                }])
+                }
                 
-                updated_df = pd.concat([df, new_entry], ignore_index=True)
-                save_data_to_db(updated_df) 
-                st.session_state.df = updated_df
-                st.rerun()
+                new_id = insert_row_to_db(new_row)
+                if new_id is not None:
+                    # Enlarge the session frame in place rather than concat-copying every row
+                    set_session_row(df, new_id, new_row)
+                    set_session_df(df)
+                    st.rerun()
+
+
+@st.cache_data(show_spinner=False, max_entries=8)
+def get_entry_id_map(_df, df_version):
+    """
+    Maps each "Job_Title - Company" identifier to its row index, in first-seen order.
+    The frame itself isn't hashed (leading underscore); df_version changes on every
+    session write, so the identifiers are only rebuilt after the data changes.
+    """
+    ids = (_df['Job_Title'].astype(str) + ' - ' + _df['Company'].astype(str)).values
+    # Built in reverse so the first row wins for duplicate identifiers
+    idx_by_id = dict(zip(ids[::-1], _df.index[::-1]))
+    return {entry_id: idx_by_id[entry_id] for entry_id in pd.unique(ids)}
 
 
 def show_modify_entry_form(df):
@@ -174,13 +371,13 @@ def show_modify_entry_form(df):
         st.info("No data available to modify.")
         return
 
-    df_temp = df.copy()
-    df_temp['Identifier'] = df_temp['Job_Title'].astype(str) + ' - ' + df_temp['Company'].astype(str)
-    identifier = st.selectbox("Select Entry to Modify:", df_temp['Identifier'].unique())
+    # Only the two identifier columns are passed in
+    idx_by_id = get_entry_id_map(df[['Job_Title', 'Company']], st.session_state.df_version)
+    identifier = st.selectbox("Select Entry to Modify:", list(idx_by_id))
     
     if identifier:
-        selected_row = df_temp[df_temp['Identifier'] == identifier].iloc[0]
-        update_index = selected_row.name
+        update_index = idx_by_id[identifier]
+        selected_row = df.loc[update_index]
         
         st.markdown(f"**Modifying:** `{identifier}`")
         
@@ -191,23 +388,36 @@ def show_modify_entry_form(df):
                     st.text(f"Date_Submitted: {selected_row[col]} (Not editable)")
                     new_values[col] = selected_row[col]
                 elif col == 'Status':
-                    current_status = str(selected_row[col]) if str(selected_row[col]) in ALLOWED_STATUSES else ALLOWED_STATUSES[0]
-                    new_values[col] = st.selectbox(f"New Status for {col}:", options=ALLOWED_STATUSES, index=ALLOWED_STATUSES.index(current_status))
+                    # Unknown statuses fall back to the first option
+                    status_index = STATUS_INDEX.get(str(selected_row[col]), 0)
+                    new_values[col] = st.selectbox(f"New Status for {col}:", options=ALLOWED_STATUSES, index=status_index)
                 else:
                     new_values[col] = st.text_area(f"New Value for {col}:", value=selected_row[col], height=50)
 
             submitted = st.form_submit_button("✅ Apply Modifications")
 
-            if submitted:
-                for col in HEADERS:
-                    df.loc[update_index, col] = new_values[col]
-                
-                save_data_to_db(df) 
-                st.session_state.df = df
+            if submitted and all(new_values[col] == selected_row[col] for col in EDITABLE_HEADERS):
+                # Nothing was edited, so skip the database write entirely (only editable
+                # columns are compared, since a missing date is NaT and NaT != NaT)
+                st.info("No changes to apply.")
+            elif submitted and update_row_in_db(update_index, new_values):
+                # Only mirror the edit in the session once it is saved
+                set_session_row(df, update_index, new_values)
+                set_session_df(df)
                 st.success(f"Entry modified successfully!")
                 st.rerun()
 
 
+@st.cache_data(show_spinner=False, max_entries=32)
+def get_unique_values(_column, col, df_version):
+    """
+    Returns the distinct values of a column for the delete form's value picker.
+    The column itself isn't hashed (leading underscore); it is keyed by its name and
+    df_version, which changes on every session write, so it is only rescanned then.
+    """
+    return _column.unique().tolist()
+
+
 def show_delete_form(df):
     """Streamlit form for deleting entries based on criteria."""
     st.header("🗑️ Delete/Filter Data")
@@ -216,23 +426,29 @@ def show_delete_form(df):
         st.info("No data available to delete.")
         return
 
-    col_to_filter = st.selectbox("Select Column to Filter/Delete By:", df.columns.tolist())
+    col_to_filter = st.selectbox("Select Column to Filter/Delete By:", HEADERS)
     
     if col_to_filter:
-        unique_values = df[col_to_filter].unique().tolist()
+        unique_values = get_unique_values(df[col_to_filter], col_to_filter, st.session_state.df_version)
         value_to_delete = st.selectbox(f"Select value in '{col_to_filter}' to DELETE:", unique_values)
         
         if st.button(f"🔥 Permanently Delete all rows where {col_to_filter} = {value_to_delete}"):
             
-            rows_before = len(df)
-            df_filtered = df[df[col_to_filter].astype(str) != str(value_to_delete)] 
-            rows_removed = rows_before - len(df_filtered)
+            if pd.isna(value_to_delete):
+                # NaT never compares equal, so missing dates are matched with notna()
+                keep_mask = df[col_to_filter].notna().to_numpy(dtype=bool)
+            else:
+                keep_mask = (df[col_to_filter] != value_to_delete).to_numpy(dtype=bool)
+            rows_removed = len(df) - int(keep_mask.sum())
             
             if rows_removed > 0:
-                save_data_to_db(df_filtered) 
-                st.session_state.df = df_filtered
-                st.success(f"Successfully deleted {rows_removed} row(s) where '{col_to_filter}' was '{value_to_delete}'.")
-                st.rerun()
+                removed_ids = df.index[~keep_mask]
+                if delete_rows_from_db(col_to_filter, value_to_delete, removed_ids):
+                    # drop() returns a new frame rather than a slice, so later in-place
+                    # set_session_row writes don't hit SettingWithCopyWarning
+                    set_session_df(df.drop(removed_ids))
+                    st.success(f"Successfully deleted {rows_removed} row(s) where '{col_to_filter}' was '{value_to_delete}'.")
+                    st.rerun()
             else:
                 st.warning(f"No rows found with the value '{value_to_delete}' to delete.")
 
@@ -244,7 +460,8 @@ st.markdown("Use the sidebar to navigate.")
 
 # 1. Initialize Session State Variables
 if 'df' not in st.session_state:
-    st.session_state.df = load_data_from_db()
+    # The add/modify forms update the session frame in place, so never hand them the cached one
+    set_session_df(load_data_from_db(get_db_mtime()).copy())
 
 
 # 2. Sidebar Navigation
@@ -1,4 +1,6 @@
 import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
 import sqlite3
 import os
 
@@ -14,8 +16,66 @@ NEW_DB_FILE = 'tracker.db'
 # 3. NAME OF THE TABLE:
 #    (Must match the table name in your Streamlit app: 'applications')
 TABLE_NAME = 'applications' 
+
+# 4. FORMAT OF THE OLD DATA FILE:
+#    (Derived from the file extension: '.parquet' and '.feather' are read via pyarrow,
+#     anything else is treated as CSV)
+SOURCE_FORMAT = os.path.splitext(OLD_CSV_PATH)[1].lstrip('.').lower()
+
+# 5. COLUMNS TO MIGRATE:
+#    (Must match HEADERS in your Streamlit app; any other column in the old file is skipped)
+HEADERS = ['Job_Title', 'Company', 'Date_Submitted', 'Requirements_Matched', 'Link', 'Status', "Require_Enhancement"]
+
+# 6. ROWS PER BATCH:
+#    (The old file is read and inserted this many rows at a time, so memory use stays flat)
+CHUNK_SIZE = 10_000
+
+# 7. DATE FORMAT OF THE OLD DATA FILE:
+#    (How older app versions wrote Date_Submitted; dates in any other format are kept as text)
+OLD_DATE_FORMAT = '%Y-%m-%d %H:%M'
 # --------------------
 
+def to_db_date(parsed, original):
+    """
+    Returns the value stored for one old Date_Submitted cell: Unix epoch seconds when it
+    parsed, None when it was empty, and otherwise the original text (like the app's own
+    conversion, dates it can't read are kept rather than lost).
+    """
+    if not pd.isna(parsed):
+        return int(parsed.timestamp())
+    if pd.isna(original) or original == '':
+        return None
+    return str(original)
+
+
+def read_old_data_in_chunks():
+    """
+    Yields the old data file as DataFrames of at most CHUNK_SIZE rows, limited to HEADERS.
+    """
+    if SOURCE_FORMAT == 'parquet':
+        parquet_file = pq.ParquetFile(OLD_CSV_PATH)
+        columns = [h for h in HEADERS if h in parquet_file.schema_arrow.names]
+        for batch in parquet_file.iter_batches(batch_size=CHUNK_SIZE, columns=columns):
+            yield batch.to_pandas()
+    elif SOURCE_FORMAT == 'feather':
+        # Feather (Arrow IPC) files are read record batch by record batch from a memory map,
+        # converting only the HEADERS columns of one CHUNK_SIZE slice at a time
+        reader = pa.ipc.open_file(pa.memory_map(OLD_CSV_PATH))
+        columns = [h for h in HEADERS if h in reader.schema.names]
+        for i in range(reader.num_record_batches):
+            batch = reader.get_batch(i).select(columns)
+            for start in range(0, batch.num_rows, CHUNK_SIZE):
+                yield batch.slice(start, CHUNK_SIZE).to_pandas()
+    else:
+        # Every column is text: skip type inference and keep empty cells as '' instead of NaN.
+        # Unknown columns are dropped by the parser, and memory_map lets it read straight
+        # from the mapped file.
+        yield from pd.read_csv(OLD_CSV_PATH, usecols=lambda c: c in HEADERS,
+                               dtype={h: 'string' for h in HEADERS}, engine='c',
+                               keep_default_na=False, na_filter=False, memory_map=True,
+                               chunksize=CHUNK_SIZE)
+
+
 def run_migration():
     """
     Loads data from the old CSV file and moves it into the new SQLite database.
@@ -23,18 +83,9 @@ def run_migration():
     print(f"--- Starting Data Migration from CSV to SQLite ---")
     print(f"Attempting to load CSV from: {OLD_CSV_PATH}")
 
-    # 1. Load data from the old CSV file
-    try:
-        if not os.path.exists(OLD_CSV_PATH):
-            print(f"ERROR: CSV file not found at {OLD_CSV_PATH}. Please check the path.")
-            return
-
-        # Read the CSV file into a DataFrame
-        df = pd.read_csv(OLD_CSV_PATH)
-        print(f"Successfully loaded {len(df)} rows from CSV.")
-
-    except Exception as e:
-        print(f"ERROR reading CSV: {e}")
+    # 1. Check the old CSV file exists (it is read batch by batch in step 3)
+    if not os.path.exists(OLD_CSV_PATH):
+        print(f"ERROR: CSV file not found at {OLD_CSV_PATH}. Please check the path.")
         return
 
     # 2. Connect to the new SQLite database
@@ -45,16 +96,35 @@ def run_migration():
         print(f"ERROR connecting to SQLite: {e}")
         return
 
-    # 3. Write the DataFrame to the SQLite table
+    # 3. Stream the old data into the SQLite table
     try:
-        # Use 'append' mode to add rows without creating a new table
+        # Rows are appended without creating a new table
         # We assume the table was already created by the Streamlit app's initialization logic.
-        df.to_sql(TABLE_NAME, conn, if_exists='append', index=False)
-        conn.commit()
+        # Each batch reuses one prepared INSERT, and all batches share a single transaction.
+        rows_migrated = 0
+        with conn:
+            for chunk in read_old_data_in_chunks():
+                # The app stores Date_Submitted as Unix epoch seconds rather than formatted text
+                if 'Date_Submitted' in chunk.columns:
+                    raw = chunk['Date_Submitted']
+                    if pd.api.types.is_datetime64_any_dtype(raw):
+                        dates = raw
+                    else:
+                        dates = pd.to_datetime(raw, format=OLD_DATE_FORMAT, errors='coerce')
+                    # object dtype keeps the ints as ints next to None/text (a float column
+                    # would be stored as '1764583200.0' in TEXT-affinity tables)
+                    epochs = pd.Series([to_db_date(d, r) for d, r in zip(dates, raw)],
+                                       index=chunk.index, dtype=object)
+                    chunk = chunk.assign(Date_Submitted=epochs)
+
+                columns = list(chunk.columns)
+                insert_sql = f"INSERT INTO {TABLE_NAME} ({', '.join(columns)}) VALUES ({', '.join('?' * len(columns))})"
+                conn.executemany(insert_sql, chunk.itertuples(index=False, name=None))
+                rows_migrated += len(chunk)
         conn.close()
-        print(f"SUCCESS: {len(df)} rows migrated and appended to table '{TABLE_NAME}'.")
+        print(f"SUCCESS: {rows_migrated} rows from {SOURCE_FORMAT.upper() or 'CSV'} migrated and appended to table '{TABLE_NAME}'.")
     except Exception as e:
-        print(f"ERROR writing data to SQLite table: {e}")
+        print(f"ERROR migrating data to SQLite table: {e}")
 
 if __name__ == "__main__":
     run_migration()